@@ -2,6 +2,7 @@ import os
 import platform
 import shutil
 import sys
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
@@ -23,25 +24,35 @@ SDKMANAGER_FILENAME = (
     "sdkmanager.bat" if platform.system() == "Windows" else "sdkmanager"
 )
 
+# The Command-Line Tools download URL for each supported host platform.
+SDK_URLS = {
+    host_os: (
+        "https://dl.google.com/android/repository/"
+        f"commandlinetools-{tag}-{SDK_MGR_DL_VER}_latest.zip"
+    )
+    for host_os, tag in [("Darwin", "mac"), ("Linux", "linux"), ("Windows", "win")]
+}
+
 
 @pytest.fixture
 def mock_tools(mock_tools) -> ToolCache:
-    # Mock the os environment, but copy over other key functions.
-    mock_tools.os.environ = {}
-    mock_tools.os.fsdecode = os.fsdecode
-    mock_tools.os.access = os.access
-    mock_tools.os.X_OK = os.X_OK
-    mock_tools.os.unlink = os.unlink
-
-    # Identify the host platform
-    mock_tools._test_download_tag = {
-        "Windows": "win",
-        "Darwin": "mac",
-        "Linux": "linux",
-    }[mock_tools.host_os]
-
-    # Use the original module rmtree implementation
-    mock_tools.shutil.rmtree = shutil.rmtree
+    # Mock the os environment, but copy over other key functions. Verifying the
+    # SDK only needs a handful of attributes, so a plain namespace is used rather
+    # than a mock of the entire module.
+    mock_tools.os = SimpleNamespace(
+        environ={},
+        fsdecode=os.fsdecode,
+        access=os.access,
+        X_OK=os.X_OK,
+        unlink=os.unlink,
+    )
+
+    # Tests that need an existing install to be deleted opt in to the original
+    # module rmtree implementation.
+    mock_tools.shutil = SimpleNamespace(
+        rmtree=MagicMock(spec_set=shutil.rmtree),
+        unpack_archive=MagicMock(spec_set=shutil.unpack_archive),
+    )
 
     return mock_tools
 
@@ -67,6 +78,55 @@ def accept_license(android_sdk_root_path):
     return _side_effect
 
 
+def create_sdk(android_sdk_root_path, cmdline_tools_version=SDK_MGR_VER, license=True):
+    """Create the layout of an installed Android SDK, with an executable
+    `sdkmanager` and (optionally) a pre-accepted license."""
+    tools_bin = android_sdk_root_path / "cmdline-tools" / cmdline_tools_version / "bin"
+    tools_bin.mkdir(parents=True, mode=0o755)
+    (tools_bin / SDKMANAGER_FILENAME).touch(mode=0o755)
+
+    if license:
+        accept_license(android_sdk_root_path)()
+
+
+def assert_sdk_downloaded(mock_tools, sdk, cache_file):
+    """Assert that the SDK was downloaded, unpacked and its license accepted."""
+    android_sdk_root_path = mock_tools.base_path / "android_sdk"
+    cmdline_tools_base_path = android_sdk_root_path / "cmdline-tools"
+
+    # Validate that the SDK was downloaded and unpacked
+    mock_tools.file.download.assert_called_once_with(
+        url=SDK_URLS[mock_tools.host_os],
+        download_path=mock_tools.base_path,
+        role="Android SDK Command-Line Tools",
+    )
+
+    mock_tools.shutil.unpack_archive.assert_called_once_with(
+        filename=cache_file,
+        extract_dir=cmdline_tools_base_path,
+        **({"filter": "data"} if sys.version_info >= (3, 12) else {}),
+    )
+
+    # The cached file will be deleted
+    cache_file.unlink.assert_called_once_with()
+
+    # The commandline tools path exists
+    assert sdk.cmdline_tools_path.is_dir()
+
+    if platform.system() != "Windows":
+        # On non-Windows, ensure the unpacked binary was made executable
+        assert os.access(
+            cmdline_tools_base_path / SDK_MGR_VER / "bin/sdkmanager",
+            os.X_OK,
+        )
+
+    # The license has been accepted
+    assert (android_sdk_root_path / "licenses/android-sdk-license").exists()
+
+    # The returned SDK has the expected root path.
+    assert sdk.root_path == android_sdk_root_path
+
+
 def test_short_circuit(mock_tools):
     """Tool is not created if already cached."""
     mock_tools.android_sdk = "tool"
@@ -139,20 +199,16 @@ def test_succeeds_immediately_in_happy_path(mock_tools, tmp_path):
 
     # Create `sdkmanager` and the license file.
     android_sdk_root_path = tmp_path / "tools/android_sdk"
-    tools_bin = android_sdk_root_path / "cmdline-tools" / SDK_MGR_VER / "bin"
-    tools_bin.mkdir(parents=True, mode=0o755)
-    (tools_bin / SDKMANAGER_FILENAME).touch(mode=0o755)
-
-    # Pre-accept the license
-    accept_license(android_sdk_root_path)()
+    create_sdk(android_sdk_root_path)
 
     # Expect verify() to succeed
     sdk = AndroidSDK.verify(mock_tools)
 
-    # No calls to download, run or unpack anything.
+    # No calls to download, run, unpack or delete anything.
     mock_tools.file.download.assert_not_called()
     mock_tools.subprocess.run.assert_not_called()
     mock_tools.shutil.unpack_archive.assert_not_called()
+    mock_tools.shutil.rmtree.assert_not_called()
 
     # The returned SDK has the expected root path.
     assert sdk.root_path == android_sdk_root_path
@@ -166,12 +222,7 @@ def test_user_provided_sdk(mock_tools, env_var, tmp_path, capsys):
 
     # Create `sdkmanager` and the license file.
     existing_android_sdk_root_path = tmp_path / "other_sdk"
-    tools_bin = existing_android_sdk_root_path / "cmdline-tools" / SDK_MGR_VER / "bin"
-    tools_bin.mkdir(parents=True, mode=0o755)
-    (tools_bin / SDKMANAGER_FILENAME).touch(mode=0o755)
-
-    # Pre-accept the license
-    accept_license(existing_android_sdk_root_path)()
+    create_sdk(existing_android_sdk_root_path)
 
     # Set the environment to specify ANDROID_SDK_ROOT
     mock_tools.os.environ = {env_var: os.fsdecode(existing_android_sdk_root_path)}
@@ -179,9 +230,10 @@ def test_user_provided_sdk(mock_tools, env_var, tmp_path, capsys):
     # Expect verify() to succeed
     sdk = AndroidSDK.verify(mock_tools)
 
-    # No calls to download or unpack anything.
+    # No calls to download, unpack or delete anything.
     mock_tools.file.download.assert_not_called()
     mock_tools.shutil.unpack_archive.assert_not_called()
+    mock_tools.shutil.rmtree.assert_not_called()
 
     # The returned SDK has the expected root path.
     assert sdk.root_path == existing_android_sdk_root_path
@@ -205,12 +257,7 @@ def test_consistent_user_provided_sdk(mock_tools, tmp_path, capsys):
 
     # Create `sdkmanager` and the license file.
     existing_android_sdk_root_path = tmp_path / "other_sdk"
-    tools_bin = existing_android_sdk_root_path / "cmdline-tools" / SDK_MGR_VER / "bin"
-    tools_bin.mkdir(parents=True, mode=0o755)
-    (tools_bin / SDKMANAGER_FILENAME).touch(mode=0o755)
-
-    # Pre-accept the license
-    accept_license(existing_android_sdk_root_path)()
+    create_sdk(existing_android_sdk_root_path)
 
     # Set the environment to specify ANDROID_SDK_ROOT
     mock_tools.os.environ = {
@@ -221,9 +268,10 @@ def test_consistent_user_provided_sdk(mock_tools, tmp_path, capsys):
     # Expect verify() to succeed
     sdk = AndroidSDK.verify(mock_tools)
 
-    # No calls to download or unpack anything.
+    # No calls to download, unpack or delete anything.
     mock_tools.file.download.assert_not_called()
     mock_tools.shutil.unpack_archive.assert_not_called()
+    mock_tools.shutil.rmtree.assert_not_called()
 
     # The returned SDK has the expected root path.
     assert sdk.root_path == existing_android_sdk_root_path
@@ -243,12 +291,7 @@ def test_inconsistent_user_provided_sdk(mock_tools, tmp_path, capsys):
 
     # Create `sdkmanager` and the license file.
     existing_android_sdk_root_path = tmp_path / "other_sdk"
-    tools_bin = existing_android_sdk_root_path / "cmdline-tools" / SDK_MGR_VER / "bin"
-    tools_bin.mkdir(parents=True, mode=0o755)
-    (tools_bin / SDKMANAGER_FILENAME).touch(mode=0o755)
-
-    # Pre-accept the license
-    accept_license(existing_android_sdk_root_path)()
+    create_sdk(existing_android_sdk_root_path)
 
     # Set the environment to specify ANDROID_HOME and ANDROID_SDK_ROOT
     mock_tools.os.environ = {
@@ -259,9 +302,10 @@ def test_inconsistent_user_provided_sdk(mock_tools, tmp_path, capsys):
     # Expect verify() to succeed
     sdk = AndroidSDK.verify(mock_tools)
 
-    # No calls to download or unpack anything.
+    # No calls to download, unpack or delete anything.
     mock_tools.file.download.assert_not_called()
     mock_tools.shutil.unpack_archive.assert_not_called()
+    mock_tools.shutil.rmtree.assert_not_called()
 
     # The returned SDK has the expected root path.
     assert sdk.root_path == existing_android_sdk_root_path
@@ -278,12 +322,7 @@ def test_invalid_user_provided_sdk(mock_tools, env_var, tmp_path, capsys):
     # Create `sdkmanager` and the license file
     # for the *briefcase* managed version of the SDK.
     android_sdk_root_path = tmp_path / "tools/android_sdk"
-    tools_bin = android_sdk_root_path / "cmdline-tools" / SDK_MGR_VER / "bin"
-    tools_bin.mkdir(parents=True, mode=0o755)
-    (tools_bin / SDKMANAGER_FILENAME).touch(mode=0o755)
-
-    # Pre-accept the license
-    accept_license(android_sdk_root_path)()
+    create_sdk(android_sdk_root_path)
 
     # Set the environment to specify an ANDROID_SDK_ROOT that doesn't exist
     mock_tools.os.environ = {env_var: os.fsdecode(tmp_path / "other_sdk")}
@@ -291,10 +330,11 @@ def test_invalid_user_provided_sdk(mock_tools, env_var, tmp_path, capsys):
     # Expect verify() to succeed
     sdk = AndroidSDK.verify(mock_tools)
 
-    # No calls to download, run or unpack anything.
+    # No calls to download, run, unpack or delete anything.
     mock_tools.file.download.assert_not_called()
     mock_tools.subprocess.run.assert_not_called()
     mock_tools.shutil.unpack_archive.assert_not_called()
+    mock_tools.shutil.rmtree.assert_not_called()
 
     # The returned SDK has the expected root path.
     assert sdk.root_path == android_sdk_root_path
@@ -314,19 +354,12 @@ def test_user_provided_sdk_wrong_cmdline_tools_ver(
     tools and the cmdline-tools install fails, the Briefcase SDK is used."""
     # Create `sdkmanager` and the license file for the *user's* version of the SDK
     user_sdk_path = tmp_path / "other_sdk"
-    user_tools_bin = user_sdk_path / "cmdline-tools/6.0/bin"
-    user_tools_bin.mkdir(parents=True, mode=0o755)
-    (user_tools_bin / SDKMANAGER_FILENAME).touch(mode=0o755)
+    create_sdk(user_sdk_path, cmdline_tools_version="6.0", license=False)
 
     # Create `sdkmanager` and the license file
     # for the *briefcase* managed version of the SDK.
     android_sdk_root_path = tmp_path / "tools/android_sdk"
-    tools_bin = android_sdk_root_path / "cmdline-tools" / SDK_MGR_VER / "bin"
-    tools_bin.mkdir(parents=True, mode=0o755)
-    (tools_bin / SDKMANAGER_FILENAME).touch(mode=0o755)
-
-    # Pre-accept the license
-    accept_license(android_sdk_root_path)()
+    create_sdk(android_sdk_root_path)
 
     # Set the environment to specify an ANDROID_SDK_ROOT that doesn't exist
     mock_tools.os.environ = {env_var: os.fsdecode(user_sdk_path)}
@@ -337,9 +370,10 @@ def test_user_provided_sdk_wrong_cmdline_tools_ver(
     # Expect verify() to succeed
     sdk = AndroidSDK.verify(mock_tools)
 
-    # No calls to download and nothing unpacked
+    # No calls to download, and nothing unpacked or deleted
     mock_tools.file.download.assert_not_called()
     mock_tools.shutil.unpack_archive.assert_not_called()
+    mock_tools.shutil.rmtree.assert_not_called()
 
     # Required Command-line Tools installed
     mock_tools.subprocess.run.assert_called_once_with(
@@ -376,12 +410,7 @@ def test_user_provided_sdk_with_latest_cmdline_tools(
     tools, the required cmdline-tools is installed in to it."""
     # Create `sdkmanager` and the license file for the *user's* version of the SDK
     user_sdk_path = tmp_path / "other_sdk"
-    user_tools_bin = user_sdk_path / "cmdline-tools/latest/bin"
-    user_tools_bin.mkdir(parents=True, mode=0o755)
-    (user_tools_bin / SDKMANAGER_FILENAME).touch(mode=0o755)
-
-    # Pre-accept the license
-    accept_license(user_sdk_path)()
+    create_sdk(user_sdk_path, cmdline_tools_version="latest")
 
     # Set the environment to specify an ANDROID_SDK_ROOT that doesn't exist
     mock_tools.os.environ = {env_var: os.fsdecode(user_sdk_path)}
@@ -389,9 +418,10 @@ def test_user_provided_sdk_with_latest_cmdline_tools(
     # Expect verify() to succeed
     sdk = AndroidSDK.verify(mock_tools)
 
-    # No calls to download and nothing unpacked
+    # No calls to download, and nothing unpacked or deleted
     mock_tools.file.download.assert_not_called()
     mock_tools.shutil.unpack_archive.assert_not_called()
+    mock_tools.shutil.rmtree.assert_not_called()
 
     # Required Command-line Tools installed
     mock_tools.subprocess.run.assert_called_once_with(
@@ -419,12 +449,7 @@ def test_consistent_invalid_user_provided_sdk(mock_tools, tmp_path, capsys):
     # Create `sdkmanager` and the license file
     # for the *briefcase* managed version of the SDK.
     android_sdk_root_path = tmp_path / "tools/android_sdk"
-    tools_bin = android_sdk_root_path / "cmdline-tools" / SDK_MGR_VER / "bin"
-    tools_bin.mkdir(parents=True, mode=0o755)
-    (tools_bin / SDKMANAGER_FILENAME).touch(mode=0o755)
-
-    # Pre-accept the license
-    accept_license(android_sdk_root_path)()
+    create_sdk(android_sdk_root_path)
 
     # Set the environment to specify an ANDROID_SDK_ROOT that doesn't exist
     mock_tools.os.environ = {
@@ -435,10 +460,11 @@ def test_consistent_invalid_user_provided_sdk(mock_tools, tmp_path, capsys):
     # Expect verify() to succeed
     sdk = AndroidSDK.verify(mock_tools)
 
-    # No calls to download, run or unpack anything.
+    # No calls to download, run, unpack or delete anything.
     mock_tools.file.download.assert_not_called()
     mock_tools.subprocess.run.assert_not_called()
     mock_tools.shutil.unpack_archive.assert_not_called()
+    mock_tools.shutil.rmtree.assert_not_called()
 
     # The returned SDK has the expected root path.
     assert sdk.root_path == android_sdk_root_path
@@ -454,12 +480,7 @@ def test_inconsistent_invalid_user_provided_sdk(mock_tools, tmp_path, capsys):
     # Create `sdkmanager` and the license file
     # for the *briefcase* managed version of the SDK.
     android_sdk_root_path = tmp_path / "tools/android_sdk"
-    tools_bin = android_sdk_root_path / "cmdline-tools" / SDK_MGR_VER / "bin"
-    tools_bin.mkdir(parents=True, mode=0o755)
-    (tools_bin / SDKMANAGER_FILENAME).touch(mode=0o755)
-
-    # Pre-accept the license
-    accept_license(android_sdk_root_path)()
+    create_sdk(android_sdk_root_path)
 
     # Set the environment to specify an ANDROID_SDK_ROOT that doesn't exist
     mock_tools.os.environ = {
@@ -470,10 +491,11 @@ def test_inconsistent_invalid_user_provided_sdk(mock_tools, tmp_path, capsys):
     # Expect verify() to succeed
     sdk = AndroidSDK.verify(mock_tools)
 
-    # No calls to download, run or unpack anything.
+    # No calls to download, run, unpack or delete anything.
     mock_tools.file.download.assert_not_called()
     mock_tools.subprocess.run.assert_not_called()
     mock_tools.shutil.unpack_archive.assert_not_called()
+    mock_tools.shutil.rmtree.assert_not_called()
 
     # The returned SDK has the expected root path.
     assert sdk.root_path == android_sdk_root_path
@@ -484,8 +506,9 @@ def test_inconsistent_invalid_user_provided_sdk(mock_tools, tmp_path, capsys):
     assert "ANDROID_HOME does not point to an Android SDK" in output
 
 
-def test_download_sdk(mock_tools, tmp_path, capsys):
-    """If an SDK is not available, one will be downloaded."""
+@pytest.mark.parametrize("pre_state", ["empty", "legacy", "bad_perms"])
+def test_download_sdk(mock_tools, pre_state, tmp_path, capsys):
+    """If a usable SDK is not available, one will be downloaded."""
     android_sdk_root_path = tmp_path / "tools/android_sdk"
     cmdline_tools_base_path = android_sdk_root_path / "cmdline-tools"
 
@@ -499,51 +522,60 @@ def test_download_sdk(mock_tools, tmp_path, capsys):
     # Set up a side effect for accepting the license
     mock_tools.subprocess.run.side_effect = accept_license(android_sdk_root_path)
 
-    # Call `verify()`
-    sdk = AndroidSDK.verify(mock_tools)
+    if pre_state == "empty":
+        sdk = AndroidSDK.verify(mock_tools)
 
-    # Validate that the SDK was downloaded and unpacked
-    url = (
-        "https://dl.google.com/android/repository/"
-        f"commandlinetools-{mock_tools._test_download_tag}-{SDK_MGR_DL_VER}_latest.zip"
-    )
-    mock_tools.file.download.assert_called_once_with(
-        url=url,
-        download_path=mock_tools.base_path,
-        role="Android SDK Command-Line Tools",
-    )
+        # There was no existing install to delete
+        mock_tools.shutil.rmtree.assert_not_called()
+        assert "The Android SDK was not found" in capsys.readouterr().out
 
-    mock_tools.shutil.unpack_archive.assert_called_once_with(
-        filename=cache_file,
-        extract_dir=cmdline_tools_base_path,
-        **({"filter": "data"} if sys.version_info >= (3, 12) else {}),
-    )
+    elif pre_state == "legacy":
+        # Create files that mock the existence of the *old* SDK tools, and some
+        # of the tools that have locations that overlap between legacy and new.
+        sdk_tools_base_path = android_sdk_root_path / "tools"
+        (sdk_tools_base_path / "bin").mkdir(parents=True)
+        (sdk_tools_base_path / "bin/sdkmanager").touch(mode=0o755)
+        (sdk_tools_base_path / "bin/avdmanager").touch(mode=0o755)
+        emulator_path = android_sdk_root_path / "emulator"
+        emulator_path.mkdir(parents=True)
+        (emulator_path / "emulator").touch(mode=0o755)
 
-    # The cached file will be deleted
-    cache_file.unlink.assert_called_once_with()
+        # The legacy install will really be deleted.
+        mock_tools.shutil.rmtree = shutil.rmtree
 
-    # The commandline tools path exists
-    assert sdk.cmdline_tools_path.is_dir()
+        sdk = AndroidSDK.verify(mock_tools)
 
-    if platform.system() != "Windows":
-        # On non-Windows, ensure the unpacked binary was made executable
-        assert os.access(
-            cmdline_tools_base_path / SDK_MGR_VER / "bin/sdkmanager",
-            os.X_OK,
-        )
+        # The legacy SDK tools have been removed
+        assert not sdk_tools_base_path.exists()
+        assert not emulator_path.exists()
 
-    # The license has been accepted
-    assert (android_sdk_root_path / "licenses/android-sdk-license").exists()
+    elif pre_state == "bad_perms":
+        # Create pre-existing non-executable `sdkmanager`.
+        sdkmanager_path = cmdline_tools_base_path / SDK_MGR_VER / "bin/sdkmanager"
+        sdkmanager_path.parent.mkdir(parents=True)
+        sdkmanager_path.touch(mode=0o644)
+        (sdkmanager_path.parent / "stale-tool").touch()
+        (cmdline_tools_base_path / SDK_MGR_DL_VER).touch()
 
-    # The returned SDK has the expected root path.
-    assert sdk.root_path == android_sdk_root_path
+        # The existing cmdline-tools will really be deleted.
+        mock_tools.shutil.rmtree = shutil.rmtree
+
+        sdk = AndroidSDK.verify(mock_tools)
+
+        # The existing cmdline-tools were replaced by the download
+        assert not (sdkmanager_path.parent / "stale-tool").exists()
+        if platform.system() != "Windows":
+            assert os.access(sdkmanager_path, os.X_OK)
 
-    assert "The Android SDK was not found" in capsys.readouterr().out
+    assert_sdk_downloaded(mock_tools, sdk, cache_file)
 
 
 def test_upgrade_existing_sdk(mock_tools, tmp_path, capsys):
     """An existing SDK is upgraded if the required version of cmdline-tools isn't
     installed."""
+    # The old cmdline-tools will really be deleted.
+    mock_tools.shutil.rmtree = shutil.rmtree
+
     android_sdk_root_path = tmp_path / "tools/android_sdk"
     cmdline_tools_base_path = android_sdk_root_path / "cmdline-tools"
 
@@ -564,41 +596,7 @@ def test_upgrade_existing_sdk(mock_tools, tmp_path, capsys):
     # Call `verify()`
     sdk = AndroidSDK.verify(mock_tools)
 
-    # Validate that the SDK was downloaded and unpacked
-    url = (
-        "https://dl.google.com/android/repository/"
-        f"commandlinetools-{mock_tools._test_download_tag}-{SDK_MGR_DL_VER}_latest.zip"
-    )
-    mock_tools.file.download.assert_called_once_with(
-        url=url,
-        download_path=mock_tools.base_path,
-        role="Android SDK Command-Line Tools",
-    )
-
-    mock_tools.shutil.unpack_archive.assert_called_once_with(
-        filename=cache_file,
-        extract_dir=cmdline_tools_base_path,
-        **({"filter": "data"} if sys.version_info >= (3, 12) else {}),
-    )
-
-    # The cached file will be deleted
-    cache_file.unlink.assert_called_once_with()
-
-    # The commandline tools path exists
-    assert sdk.cmdline_tools_path.is_dir()
-
-    if platform.system() != "Windows":
-        # On non-Windows, ensure the unpacked binary was made executable
-        assert os.access(
-            cmdline_tools_base_path / SDK_MGR_VER / "bin/sdkmanager",
-            os.X_OK,
-        )
-
-    # The license has been accepted
-    assert (android_sdk_root_path / "licenses/android-sdk-license").exists()
-
-    # The returned SDK has the expected root path.
-    assert sdk.root_path == android_sdk_root_path
+    assert_sdk_downloaded(mock_tools, sdk, cache_file)
 
     # Ensure old cmdline-tools installs are cleaned up
     assert not (cmdline_tools_base_path / "latest").exists()
@@ -607,77 +605,7 @@ def test_upgrade_existing_sdk(mock_tools, tmp_path, capsys):
     assert "Upgrading Android SDK..." in capsys.readouterr().out
 
 
-def test_download_sdk_legacy_install(mock_tools, tmp_path):
-    """If the legacy SDK tools are present, they will be deleted."""
-    android_sdk_root_path = tmp_path / "tools/android_sdk"
-    cmdline_tools_base_path = android_sdk_root_path / "cmdline-tools"
-
-    # Create files that mock the existence of the *old* SDK tools.
-    sdk_tools_base_path = android_sdk_root_path / "tools"
-    (sdk_tools_base_path / "bin").mkdir(parents=True)
-    (sdk_tools_base_path / "bin/sdkmanager").touch(mode=0o755)
-    (sdk_tools_base_path / "bin/avdmanager").touch(mode=0o755)
-
-    # Create some of the tools that have locations that overlap
-    # between legacy and new.
-    emulator_path = android_sdk_root_path / "emulator"
-    emulator_path.mkdir(parents=True)
-    (emulator_path / "emulator").touch(mode=0o755)
-
-    # The download will produce a cached file.
-    cache_file = MagicMock()
-    mock_tools.file.download = MagicMock(return_value=cache_file)
-
-    # Calling unpack will create files
-    mock_tools.shutil.unpack_archive.side_effect = mock_unpack
-
-    # Set up a side effect for accepting the license
-    mock_tools.subprocess.run.side_effect = accept_license(android_sdk_root_path)
-
-    # Call `verify()`
-    sdk = AndroidSDK.verify(mock_tools)
-
-    # Validate that the SDK was downloaded and unpacked
-    url = (
-        "https://dl.google.com/android/repository/"
-        f"commandlinetools-{mock_tools._test_download_tag}-{SDK_MGR_DL_VER}_latest.zip"
-    )
-    mock_tools.file.download.assert_called_once_with(
-        url=url,
-        download_path=mock_tools.base_path,
-        role="Android SDK Command-Line Tools",
-    )
-
-    mock_tools.shutil.unpack_archive.assert_called_once_with(
-        filename=cache_file,
-        extract_dir=cmdline_tools_base_path,
-        **({"filter": "data"} if sys.version_info >= (3, 12) else {}),
-    )
-
-    # The cached file will be deleted
-    cache_file.unlink.assert_called_once_with()
-
-    # The commandline tools path exists, in both "latest" and versioned form
-    assert sdk.cmdline_tools_path.is_dir()
-
-    if platform.system() != "Windows":
-        # On non-Windows, ensure the unpacked binary was made executable
-        assert os.access(
-            cmdline_tools_base_path / SDK_MGR_VER / "bin/sdkmanager", os.X_OK
-        )
-
-    # The legacy SDK tools have been removed
-    assert not sdk_tools_base_path.exists()
-    assert not emulator_path.exists()
-
-    # The license has been accepted
-    assert (android_sdk_root_path / "licenses/android-sdk-license").exists()
-
-    # The returned SDK has the expected root path.
-    assert sdk.root_path == android_sdk_root_path
-
-
-def test_no_install(mock_tools, tmp_path):
+def test_no_install(mock_tools):
     """If an SDK is not available, and install is not requested, an error is raised."""
 
     # Call `verify()`
@@ -687,57 +615,6 @@ def test_no_install(mock_tools, tmp_path):
     assert mock_tools.file.download.call_count == 0
 
 
-def test_download_sdk_if_sdkmanager_not_executable(mock_tools, tmp_path):
-    """An SDK will be downloaded and unpacked if `tools/bin/sdkmanager` exists but does
-    not have its permissions set properly."""
-    android_sdk_root_path = tmp_path / "tools/android_sdk"
-    cmdline_tools_base_path = android_sdk_root_path / "cmdline-tools"
-
-    # Create pre-existing non-executable `sdkmanager`.
-    (cmdline_tools_base_path / SDK_MGR_VER / "bin").mkdir(parents=True)
-    (cmdline_tools_base_path / SDK_MGR_VER / "bin/sdkmanager").touch(mode=0o644)
-    (cmdline_tools_base_path / SDK_MGR_DL_VER).touch()
-
-    # The download will produce a cached file
-    cache_file = MagicMock()
-    mock_tools.file.download = MagicMock(return_value=cache_file)
-
-    # Calling unpack will create files
-    mock_tools.shutil.unpack_archive.side_effect = mock_unpack
-
-    # Set up a side effect for accepting the license
-    mock_tools.subprocess.run.side_effect = accept_license(android_sdk_root_path)
-
-    # Call `verify()`
-    sdk = AndroidSDK.verify(mock_tools)
-
-    # Validate that the SDK was downloaded and unpacked
-    url = (
-        "https://dl.google.com/android/repository/"
-        f"commandlinetools-{mock_tools._test_download_tag}-{SDK_MGR_DL_VER}_latest.zip"
-    )
-    mock_tools.file.download.assert_called_once_with(
-        url=url,
-        download_path=mock_tools.base_path,
-        role="Android SDK Command-Line Tools",
-    )
-
-    mock_tools.shutil.unpack_archive.assert_called_once_with(
-        filename=cache_file,
-        extract_dir=cmdline_tools_base_path,
-        **({"filter": "data"} if sys.version_info >= (3, 12) else {}),
-    )
-
-    # The cached file will be deleted
-    cache_file.unlink.assert_called_once_with()
-
-    # The license has been accepted
-    assert (android_sdk_root_path / "licenses/android-sdk-license").exists()
-
-    # The returned SDK has the expected root path.
-    assert sdk.root_path == android_sdk_root_path
-
-
 def test_raises_networkfailure_on_connectionerror(mock_tools):
     """If an error occurs downloading the ZIP file, and error is raised."""
     mock_tools.file.download = MagicMock(side_effect=NetworkFailure("mock"))
@@ -746,17 +623,14 @@ def test_raises_networkfailure_on_connectionerror(mock_tools):
         AndroidSDK.verify(mock_tools)
 
     # The download was attempted
-    url = (
-        "https://dl.google.com/android/repository/"
-        f"commandlinetools-{mock_tools._test_download_tag}-{SDK_MGR_DL_VER}_latest.zip"
-    )
     mock_tools.file.download.assert_called_once_with(
-        url=url,
+        url=SDK_URLS[mock_tools.host_os],
         download_path=mock_tools.base_path,
         role="Android SDK Command-Line Tools",
     )
-    # But no unpack occurred
+    # But no unpack or delete occurred
     assert mock_tools.shutil.unpack_archive.call_count == 0
+    mock_tools.shutil.rmtree.assert_not_called()
 
 
 def test_detects_bad_zipfile(mock_tools, tmp_path):
@@ -773,12 +647,8 @@ def test_detects_bad_zipfile(mock_tools, tmp_path):
         AndroidSDK.verify(mock_tools)
 
     # The download attempt was made.
-    url = (
-        "https://dl.google.com/android/repository/"
-        f"commandlinetools-{mock_tools._test_download_tag}-{SDK_MGR_DL_VER}_latest.zip"
-    )
     mock_tools.file.download.assert_called_once_with(
-        url=url,
+        url=SDK_URLS[mock_tools.host_os],
         download_path=mock_tools.base_path,
         role="Android SDK Command-Line Tools",
     )
@@ -787,3 +657,6 @@ def test_detects_bad_zipfile(mock_tools, tmp_path):
         extract_dir=android_sdk_root_path / "cmdline-tools",
         **({"filter": "data"} if sys.version_info >= (3, 12) else {}),
     )
+
+    # The failed unpack didn't delete anything
+    mock_tools.shutil.rmtree.assert_not_called()
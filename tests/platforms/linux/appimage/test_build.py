@@ -2,6 +2,7 @@ import os
 import shutil
 import subprocess
 import sys
+from itertools import chain
 from unittest import mock
 
 import pytest
@@ -19,21 +20,30 @@ from briefcase.platforms.linux.appimage import LinuxAppImageBuildCommand
 
 from ....utils import create_file
 
+# Paths in the first app's AppDir that linuxdeploy collects dependencies for.
+DEPLOY_DEPS_PATHS = (
+    "usr/app/support",
+    "usr/app_packages/firstlib",
+    "usr/app_packages/secondlib",
+)
+
 
 @pytest.fixture
-def first_app(first_app_config, tmp_path):
+def first_app(first_app_config, app_dir):
     """A fixture for the first app, rolled out on disk."""
     # Make it look like the template has been generated
-    app_dir = tmp_path / "base_path/build/first-app/linux/appimage/First App.AppDir"
-    (app_dir / "usr/app/support").mkdir(parents=True, exist_ok=True)
-    (app_dir / "usr/app_packages/firstlib").mkdir(parents=True, exist_ok=True)
-    (app_dir / "usr/app_packages/secondlib").mkdir(parents=True, exist_ok=True)
-
-    # Create some .so files
-    (app_dir / "usr/app/support/support.so").touch()
-    (app_dir / "usr/app_packages/firstlib/first.so").touch()
-    (app_dir / "usr/app_packages/secondlib/second_a.so").touch()
-    (app_dir / "usr/app_packages/secondlib/second_b.so").touch()
+    for path in DEPLOY_DEPS_PATHS:
+        (app_dir / path).mkdir(parents=True, exist_ok=True)
+
+    # Create some empty .so files. There's no existing file to update, so the
+    # utime() that Path.touch() also performs can be skipped.
+    for so_path in [
+        app_dir / "usr/app/support/support.so",
+        app_dir / "usr/app_packages/firstlib/first.so",
+        app_dir / "usr/app_packages/secondlib/second_a.so",
+        app_dir / "usr/app_packages/secondlib/second_b.so",
+    ]:
+        os.close(os.open(so_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644))
 
     return first_app_config
 
@@ -87,6 +97,31 @@ def build_command(dummy_console, tmp_path, first_app_config):
     return command
 
 
+@pytest.fixture
+def app_dir(tmp_path):
+    """The AppDir of the first app."""
+    return tmp_path / "base_path/build/first-app/linux/appimage/First App.AppDir"
+
+
+@pytest.fixture
+def linuxdeploy_argv(tmp_path, app_dir):
+    """The arguments used to invoke linuxdeploy on the first app, with no plugins."""
+    return [
+        os.fsdecode(tmp_path / "briefcase/tools/linuxdeploy-x86_64.AppImage"),
+        "--appdir",
+        os.fsdecode(app_dir),
+        "--desktop-file",
+        os.fsdecode(app_dir / "com.example.first-app.desktop"),
+        "--output",
+        "appimage",
+        "-v1",
+        *chain.from_iterable(
+            ("--deploy-deps-only", os.fsdecode(app_dir / path))
+            for path in DEPLOY_DEPS_PATHS
+        ),
+    ]
+
+
 def test_verify_tools_wrong_platform(build_command):
     """If we're not on Linux, the build fails."""
 
@@ -137,17 +172,29 @@ def test_verify_tools_download_failure(build_command):
 
 
 @pytest.mark.parametrize("debug_mode", (True, False))
-def test_build_appimage(build_command, first_app, debug_mode, tmp_path, sub_stream_kw):
+def test_build_appimage(
+    build_command,
+    first_app,
+    debug_mode,
+    app_dir,
+    linuxdeploy_argv,
+    tmp_path,
+    sub_stream_kw,
+    monkeypatch,
+):
     """A Linux app can be packaged as an AppImage."""
+    # Don't let a console attached to stdout determine the output encoding.
+    monkeypatch.setattr(os, "device_encoding", mock.MagicMock(return_value=None))
+
     # Enable verbose tool logging
     if debug_mode:
         build_command.tools.console.verbosity = LogLevel.DEEP_DEBUG
+        linuxdeploy_argv[linuxdeploy_argv.index("-v1")] = "-v0"
 
     build_command.verify_app_tools(first_app)
     build_command.build_app(first_app)
 
     # linuxdeploy was invoked
-    app_dir = tmp_path / "base_path/build/first-app/linux/appimage/First App.AppDir"
     expected_env = {
         "PATH": "/usr/local/bin:/usr/bin:/path/to/somewhere",
         "LINUXDEPLOY_OUTPUT_VERSION": "0.0.1",
@@ -157,27 +204,15 @@ def test_build_appimage(build_command, first_app, debug_mode, tmp_path, sub_stre
     }
     if debug_mode:
         expected_env["DEBUG"] = "1"
-    build_command._subprocess.Popen.assert_called_with(
-        [
-            os.fsdecode(tmp_path / "briefcase/tools/linuxdeploy-x86_64.AppImage"),
-            "--appdir",
-            os.fsdecode(app_dir),
-            "--desktop-file",
-            os.fsdecode(app_dir / "com.example.first-app.desktop"),
-            "--output",
-            "appimage",
-            "-v0" if debug_mode else "-v1",
-            "--deploy-deps-only",
-            os.fsdecode(app_dir / "usr/app/support"),
-            "--deploy-deps-only",
-            os.fsdecode(app_dir / "usr/app_packages/firstlib"),
-            "--deploy-deps-only",
-            os.fsdecode(app_dir / "usr/app_packages/secondlib"),
-        ],
-        env=expected_env,
-        cwd=os.fsdecode(tmp_path / "base_path/build/first-app/linux/appimage"),
+    popen_args, popen_kwargs = build_command._subprocess.Popen.call_args
+    assert popen_args == (linuxdeploy_argv,)
+    # Without a console encoding, output is decoded as UTF-8.
+    assert popen_kwargs == {
         **sub_stream_kw,
-    )
+        "env": expected_env,
+        "cwd": os.fsdecode(tmp_path / "base_path/build/first-app/linux/appimage"),
+        "encoding": "UTF-8",
+    }
     # Binary is marked executable
     build_command.tools.os.chmod.assert_called_with(
         tmp_path
@@ -190,7 +225,14 @@ def test_build_appimage(build_command, first_app, debug_mode, tmp_path, sub_stre
     sys.platform == "win32",
     reason="Windows paths can't be passed to linuxdeploy",
 )
-def test_build_appimage_with_plugin(build_command, first_app, tmp_path, sub_stream_kw):
+def test_build_appimage_with_plugin(
+    build_command,
+    first_app,
+    app_dir,
+    linuxdeploy_argv,
+    tmp_path,
+    sub_stream_kw,
+):
     """A Linux app can be packaged as an AppImage with a plugin."""
     # Mock the existence of some plugins
     gtk_plugin_path = (
@@ -214,23 +256,9 @@ def test_build_appimage_with_plugin(build_command, first_app, tmp_path, sub_stre
     build_command.build_app(first_app)
 
     # linuxdeploy was invoked
-    app_dir = tmp_path / "base_path/build/first-app/linux/appimage/First App.AppDir"
     build_command._subprocess.Popen.assert_called_with(
         [
-            os.fsdecode(tmp_path / "briefcase/tools/linuxdeploy-x86_64.AppImage"),
-            "--appdir",
-            os.fsdecode(app_dir),
-            "--desktop-file",
-            os.fsdecode(app_dir / "com.example.first-app.desktop"),
-            "--output",
-            "appimage",
-            "-v1",
-            "--deploy-deps-only",
-            os.fsdecode(app_dir / "usr/app/support"),
-            "--deploy-deps-only",
-            os.fsdecode(app_dir / "usr/app_packages/firstlib"),
-            "--deploy-deps-only",
-            os.fsdecode(app_dir / "usr/app_packages/secondlib"),
+            *linuxdeploy_argv,
             "--plugin",
             "gtk",
             "--plugin",
@@ -261,7 +289,13 @@ def test_build_appimage_with_plugin(build_command, first_app, tmp_path, sub_stre
     )
 
 
-def test_build_failure(build_command, first_app, tmp_path, sub_stream_kw):
+def test_build_failure(
+    build_command,
+    first_app,
+    linuxdeploy_argv,
+    tmp_path,
+    sub_stream_kw,
+):
     """If linuxdeploy fails, the build is stopped."""
     # Mock a failure in the build
     build_command._subprocess.Popen.side_effect = subprocess.CalledProcessError(
@@ -274,24 +308,8 @@ def test_build_failure(build_command, first_app, tmp_path, sub_stream_kw):
         build_command.build_app(first_app)
 
     # linuxdeploy was invoked
-    app_dir = tmp_path / "base_path/build/first-app/linux/appimage/First App.AppDir"
     build_command._subprocess.Popen.assert_called_with(
-        [
-            os.fsdecode(tmp_path / "briefcase/tools/linuxdeploy-x86_64.AppImage"),
-            "--appdir",
-            os.fsdecode(app_dir),
-            "--desktop-file",
-            os.fsdecode(app_dir / "com.example.first-app.desktop"),
-            "--output",
-            "appimage",
-            "-v1",
-            "--deploy-deps-only",
-            os.fsdecode(app_dir / "usr/app/support"),
-            "--deploy-deps-only",
-            os.fsdecode(app_dir / "usr/app_packages/firstlib"),
-            "--deploy-deps-only",
-            os.fsdecode(app_dir / "usr/app_packages/secondlib"),
-        ],
+        linuxdeploy_argv,
         env={
             "PATH": "/usr/local/bin:/usr/bin:/path/to/somewhere",
             "LINUXDEPLOY_OUTPUT_VERSION": "0.0.1",
@@ -374,12 +392,10 @@ def test_build_appimage_in_docker(
             "--output",
             "appimage",
             "-v1",
-            "--deploy-deps-only",
-            "/app/First App.AppDir/usr/app/support",
-            "--deploy-deps-only",
-            "/app/First App.AppDir/usr/app_packages/firstlib",
-            "--deploy-deps-only",
-            "/app/First App.AppDir/usr/app_packages/secondlib",
+            *chain.from_iterable(
+                ("--deploy-deps-only", f"/app/First App.AppDir/{path}")
+                for path in DEPLOY_DEPS_PATHS
+            ),
         ],
         env={
             "PATH": "/usr/local/bin:/usr/bin:/path/to/somewhere",
@@ -488,12 +504,10 @@ def test_build_appimage_with_plugins_in_docker(
             "--output",
             "appimage",
             "-v1",
-            "--deploy-deps-only",
-            "/app/First App.AppDir/usr/app/support",
-            "--deploy-deps-only",
-            "/app/First App.AppDir/usr/app_packages/firstlib",
-            "--deploy-deps-only",
-            "/app/First App.AppDir/usr/app_packages/secondlib",
+            *chain.from_iterable(
+                ("--deploy-deps-only", f"/app/First App.AppDir/{path}")
+                for path in DEPLOY_DEPS_PATHS
+            ),
             "--plugin",
             "gtk",
             "--plugin",
@@ -522,6 +536,7 @@ def test_build_appimage_with_plugins_in_docker(
 def test_build_appimage_with_support_package_update(
     build_command,
     first_app,
+    linuxdeploy_argv,
     sub_stream_kw,
     tmp_path,
     capsys,
@@ -564,24 +579,8 @@ def test_build_appimage_with_support_package_update(
     build_command(first_app, update_support=True)
 
     # linuxdeploy was invoked
-    app_dir = tmp_path / "base_path/build/first-app/linux/appimage/First App.AppDir"
     build_command._subprocess.Popen.assert_called_with(
-        [
-            os.fsdecode(tmp_path / "briefcase/tools/linuxdeploy-x86_64.AppImage"),
-            "--appdir",
-            os.fsdecode(app_dir),
-            "--desktop-file",
-            os.fsdecode(app_dir / "com.example.first-app.desktop"),
-            "--output",
-            "appimage",
-            "-v1",
-            "--deploy-deps-only",
-            os.fsdecode(app_dir / "usr/app/support"),
-            "--deploy-deps-only",
-            os.fsdecode(app_dir / "usr/app_packages/firstlib"),
-            "--deploy-deps-only",
-            os.fsdecode(app_dir / "usr/app_packages/secondlib"),
-        ],
+        linuxdeploy_argv,
         env={
             "PATH": "/usr/local/bin:/usr/bin:/path/to/somewhere",
             "LINUXDEPLOY_OUTPUT_VERSION": "0.0.1",